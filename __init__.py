@@ -2,14 +2,14 @@
 Wraith Client - Python client for Wraith telemetry daemon.
 
 Usage:
-    from wraith_client import WraithClient
+    from wraith_client import get_client
     
-    client = WraithClient()
+    client = get_client()
     client.tool_invoked("migrateiq", "scan")
     client.tool_succeeded("migrateiq", "scan", duration_ms=1234)
 """
 
-from wraith_client.client import WraithClient, Level
+from wraith_client.client import WraithClient, Level, get_client
 
-__all__ = ["WraithClient", "Level"]
+__all__ = ["WraithClient", "Level", "get_client"]
 __version__ = "0.1.0"
@@ -1,24 +1,41 @@
 """
 Wraith Client - Fire-and-forget telemetry client.
 
-Sends events to the Wraith daemon over a Unix socket.
-All operations are non-blocking and fail silently.
+Sends events to the Wraith daemon as newline-delimited JSON over a
+Unix stream socket. All operations are non-blocking and fail silently.
 """
 
 import atexit
 import json
 import os
-import platform
 import socket
-import subprocess
 import sys
 import threading
 import time
-import uuid
+import weakref
+from collections import deque
 from contextlib import contextmanager
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Callable
+
+# Background worker settings
+_QUEUE_SIZE = 4096  # Max pending events; oldest are dropped on overflow
+_BATCH_SIZE = 64    # Max events written per socket flush
+_IDLE_CHECK = 1.0   # How often an idle worker checks its client still exists
+_SOCKET_TIMEOUT = 1.0  # Connect/send timeout on the Wraith socket
+_EXIT_FLUSH_TIMEOUT = 0.5  # How long exit waits for a connected worker
+_SEND_BUFFER = 1 << 20  # Socket send buffer, so bursts don't stall the worker
+
+# Reconnect backoff after a failed connect or a dropped connection (seconds)
+_RECONNECT_MIN = 0.1
+_RECONNECT_MAX = 1.0
+
+# Polling for the socket after spawning Wraith (seconds)
+_SPAWN_TIMEOUT = 1.0
+_SPAWN_POLL_MIN = 0.001
+_SPAWN_POLL_MAX = 0.1
 
 
 class Level(Enum):
@@ -31,30 +48,69 @@ class Level(Enum):
     FATAL = "FATAL"
 
 
+def _json_dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes with the stdlib encoder."""
+    return json.dumps(value).encode()
+
+
+# Event serializer and pre-serialized level values for event templates.
+# Set up by the first client (not at import) since orjson is slow to import.
+_dumps: Optional[Callable[[Any], bytes]] = None
+_LEVEL_JSON: Dict[Level, bytes] = {}
+
+
+def _load_serializer():
+    """Pick the event serializer: orjson if installed, else the stdlib."""
+    global _dumps
+    if _dumps is not None:
+        return
+    
+    try:
+        import orjson
+        dumps = orjson.dumps
+    except ImportError:
+        dumps = _json_dumps
+    
+    _LEVEL_JSON.update((level, dumps(level.value)) for level in Level)
+    _dumps = dumps
+
+
+# Paths are resolved on first use (not at import) so a missing HOME
+# doesn't break importing the module
+@lru_cache(maxsize=None)
+def _infraiq_dir() -> Path:
+    """Get InfraIQ directory."""
+    return Path.home() / ".infraiq"
+
+
+@lru_cache(maxsize=None)
+def _default_socket_path() -> Path:
+    """Get default socket path."""
+    return _infraiq_dir() / "wraith.sock"
+
+
 class WraithClient:
     """
     Client for sending events to the Wraith telemetry daemon.
     
     All operations are fire-and-forget - they never block or raise exceptions.
+    Events are queued and written to the socket by a background worker thread.
     If Wraith is not running, events are silently dropped.
     
+    Use get_client() for the shared per-process instance; constructing
+    WraithClient directly creates a separate client with its own worker.
+    
     Usage:
-        client = WraithClient()
+        client = get_client()
         client.tool_invoked("migrateiq", "scan")
         client.tool_succeeded("migrateiq", "scan", duration_ms=1234)
     """
     
-    # Class-level singleton
-    _instance: Optional["WraithClient"] = None
-    _lock = threading.Lock()
+    # Config file opt-out result, cached for the process
+    _config_consent: Optional[bool] = None
     
-    def __new__(cls, *args, **kwargs):
-        """Singleton pattern - one client per process."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    # Wraith binary location, cached once found
+    _wraith_binary: Optional[Path] = None
     
     def __init__(
         self,
@@ -72,31 +128,62 @@ class WraithClient:
             auto_spawn: Whether to spawn Wraith if not running. Default: True
             enabled: Whether telemetry is enabled. Default: True
         """
-        # Only initialize once
-        if hasattr(self, "_initialized"):
-            return
-        self._initialized = True
-        
         self._enabled = enabled and self._check_consent()
-        self._socket_path = socket_path or self._default_socket_path()
+        self._socket_path = socket_path or _default_socket_path()
         self._tool_version = tool_version or self._get_tool_version()
         self._installation_id = self._get_or_create_installation_id()
+        self._context = self._build_context_once()
+        self._build_templates()
         self._auto_spawn = auto_spawn
+        
+        # Connection state, owned by the worker thread
         self._socket: Optional[socket.socket] = None
-        self._connect_lock = threading.Lock()
+        self._sock_fd = -1
+        self._first_connect = True
+        self._retry_at = 0.0
+        self._retry_delay = _RECONNECT_MIN
+        
+        # Events are serialized and sent off the caller's thread
+        self._init_worker()
         
-        # Register cleanup
-        atexit.register(self._cleanup)
+        # Register cleanup (weakly, so the exit hook doesn't keep us alive)
+        _clients.add(self)
     
-    @staticmethod
-    def _default_socket_path() -> Path:
-        """Get default socket path."""
-        return Path.home() / ".infraiq" / "wraith.sock"
+    def _init_worker(self):
+        """Set up the event queue and the (not yet started) worker thread."""
+        self._queue: "deque[bytes]" = deque(maxlen=_QUEUE_SIZE)
+        self._wakeup = threading.Event()
+        self._stopping = False
+        # Holds this client while lines are queued, so they get flushed
+        # even if the caller drops the client right away
+        self._pending: List[Optional["WraithClient"]] = [None]
+        # The worker starts with the first event, so idle clients cost nothing.
+        # It only references the client weakly and exits once it is collected.
+        self._worker = threading.Thread(
+            target=_run_worker,
+            args=(weakref.ref(self), self._pending, self._wakeup),
+            name="wraith-client",
+            daemon=True,
+        )
+        self._worker_started = False
+        self._worker_lock = threading.Lock()
     
-    @staticmethod
-    def _default_infraiq_dir() -> Path:
-        """Get InfraIQ directory."""
-        return Path.home() / ".infraiq"
+    def _reset_after_fork(self):
+        """Reset per-process state in a forked child, which has no worker."""
+        # The socket is shared with the parent: close only our copy of the
+        # fd (never shut it down) and let the child connect on its own
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except OSError:
+                pass
+        self._socket = None
+        self._sock_fd = -1
+        self._retry_at = 0.0
+        self._retry_delay = _RECONNECT_MIN
+        
+        # Lines queued in the parent are the parent's to send
+        self._init_worker()
     
     def _check_consent(self) -> bool:
         """Check if user has opted out of telemetry."""
@@ -104,16 +191,30 @@ class WraithClient:
         if os.environ.get("INFRAIQ_TELEMETRY", "").lower() in ("0", "false", "no", "off"):
             return False
         
-        # Check config file
-        config_file = self._default_infraiq_dir() / "config.json"
-        if config_file.exists():
-            try:
-                with open(config_file) as f:
-                    config = json.load(f)
-                    if config.get("telemetry") is False:
-                        return False
-            except Exception:
-                pass
+        # Check config file (read once per process)
+        cls = type(self)
+        if cls._config_consent is None:
+            cls._config_consent = self._read_config_consent()
+        return cls._config_consent
+    
+    def _read_config_consent(self) -> bool:
+        """Check the config file for a telemetry opt-out."""
+        config_file = _infraiq_dir() / "config.json"
+        try:
+            data = config_file.read_bytes()
+        except OSError:
+            return True
+        
+        # Skip the JSON parse when the setting isn't mentioned at all
+        if b'"telemetry"' not in data:
+            return True
+        
+        try:
+            config = json.loads(data)
+            if config.get("telemetry") is False:
+                return False
+        except (ValueError, AttributeError):
+            pass
         
         return True
     
@@ -122,12 +223,12 @@ class WraithClient:
         try:
             from importlib.metadata import version
             return version("infraiq-suite")
-        except Exception:
+        except ImportError:
             return "unknown"
     
     def _get_or_create_installation_id(self) -> str:
         """Get or create persistent installation ID."""
-        id_file = self._default_infraiq_dir() / "installation_id"
+        id_file = _infraiq_dir() / "installation_id"
         
         # Try to read existing
         if id_file.exists():
@@ -135,23 +236,27 @@ class WraithClient:
                 installation_id = id_file.read_text().strip()
                 if installation_id:
                     return installation_id
-            except Exception:
+            except (OSError, ValueError):
                 pass
         
         # Generate new
+        import uuid
         installation_id = str(uuid.uuid4())
         
         # Save it
         try:
             id_file.parent.mkdir(parents=True, exist_ok=True)
             id_file.write_text(installation_id)
-        except Exception:
+        except OSError:
             pass
         
         return installation_id
     
-    def _build_context(self) -> Dict[str, Any]:
-        """Build event context."""
+    def _build_context_once(self) -> Dict[str, Any]:
+        """Build event context. Values are process-constant, so this runs once."""
+        # Imported here to keep importing wraith_client cheap
+        import platform
+        
         return {
             "installation_id": self._installation_id,
             "tool_version": self._tool_version,
@@ -160,8 +265,50 @@ class WraithClient:
             "os_version": platform.release(),
         }
     
+    def _build_context(self) -> Dict[str, Any]:
+        """Get the cached event context (shared, do not mutate)."""
+        return self._context
+    
+    def _template(self, event_type: str, *fields: str) -> bytes:
+        """
+        Pre-serialize an event, leaving %b slots for the variable fields.
+        
+        The level slot comes first, followed by one slot per field in order.
+        Slots are filled with already JSON-encoded values.
+        """
+        parts = [b'"level":%b', b'"event_type":' + _dumps(event_type)]
+        parts.extend(_dumps(field) + b":%b" for field in fields)
+        context = _dumps(self._build_context()).replace(b"%", b"%%")
+        parts.append(b'"context":' + context)
+        return b"{" + b",".join(parts) + b"}\n"
+    
+    def _build_templates(self):
+        """Build the per-event templates used by the public API."""
+        _load_serializer()
+        self._tpl_invoked = self._template("tool_invoked", "tool", "command")
+        self._tpl_succeeded = self._template(
+            "tool_succeeded", "tool", "command", "duration_ms"
+        )
+        self._tpl_failed = self._template(
+            "tool_failed", "tool", "command", "error_type", "duration_ms"
+        )
+        self._tpl_exception = self._template(
+            "exception_unhandled", "tool", "exception_type"
+        )
+        self._tpl_exception_tb = self._template(
+            "exception_unhandled", "tool", "exception_type", "traceback"
+        )
+        self._tpl_validation = self._template(
+            "validation_failed", "tool", "validation_type"
+        )
+        self._tpl_validation_details = self._template(
+            "validation_failed", "tool", "validation_type", "details"
+        )
+    
     def _spawn_wraith(self) -> bool:
         """Spawn Wraith daemon if not running."""
+        import subprocess
+        
         try:
             # Check if wraith binary is available
             wraith_path = self._find_wraith_binary()
@@ -177,92 +324,213 @@ class WraithClient:
                 start_new_session=True,
             )
             
-            # Wait briefly for socket to be created
-            for _ in range(10):
-                time.sleep(0.1)
+            # Wait briefly for socket to be created, polling quickly at first
+            deadline = time.monotonic() + _SPAWN_TIMEOUT
+            delay = _SPAWN_POLL_MIN
+            while time.monotonic() < deadline:
+                time.sleep(delay)
                 if self._socket_path.exists():
                     return True
+                delay = min(delay * 2, _SPAWN_POLL_MAX)
             
             return False
-        except Exception:
+        except (OSError, ValueError, subprocess.SubprocessError):
+            # ValueError: bad arguments, e.g. a NUL byte in the binary path
             return False
     
     def _find_wraith_binary(self) -> Optional[Path]:
         """Find the wraith binary."""
+        import shutil
+        
+        cls = type(self)
+        if cls._wraith_binary is not None:
+            return cls._wraith_binary
+        
         # Check common locations
         candidates = [
-            Path.home() / ".infraiq" / "bin" / "wraith",
+            _infraiq_dir() / "bin" / "wraith",
             Path("/usr/local/bin/wraith"),
             Path("/usr/bin/wraith"),
         ]
         
         # Also check PATH
-        try:
-            result = subprocess.run(
-                ["which", "wraith"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                candidates.insert(0, Path(result.stdout.strip()))
-        except Exception:
-            pass
+        on_path = shutil.which("wraith")
+        if on_path:
+            candidates.insert(0, Path(on_path))
         
         for path in candidates:
             if path.exists() and os.access(path, os.X_OK):
+                cls._wraith_binary = path
                 return path
         
         return None
     
     def _connect(self) -> bool:
-        """Connect to Wraith socket."""
-        with self._connect_lock:
-            if self._socket is not None:
-                return True
-            
-            # Check if socket exists
-            if not self._socket_path.exists():
-                if self._auto_spawn:
-                    if not self._spawn_wraith():
+        """Connect to Wraith socket. Only called from the worker thread."""
+        if self._socket is not None:
+            return True
+        
+        # Back off after a failure instead of retrying on every batch
+        if time.monotonic() < self._retry_at:
+            return False
+        
+        try:
+            # Look for (or spawn) the daemon only on the first attempt
+            if self._first_connect:
+                self._first_connect = False
+                if not self._socket_path.exists():
+                    if not (self._auto_spawn and self._spawn_wraith()):
+                        self._schedule_reconnect()
                         return False
-                else:
-                    return False
             
-            try:
-                self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                self._socket.settimeout(1.0)
-                self._socket.connect(str(self._socket_path))
-                return True
-            except Exception:
-                self._socket = None
-                return False
-    
-    def _send(self, message: Dict[str, Any]) -> bool:
-        """Send a message to Wraith."""
-        if not self._enabled:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        except OSError:
+            self._schedule_reconnect()
             return False
         
-        if not self._connect():
-            return False
+        try:
+            # Best effort - the kernel may clamp or refuse the size
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SEND_BUFFER)
+        except OSError:
+            pass
         
         try:
-            data = json.dumps(message) + "\n"
-            self._socket.sendall(data.encode())
-            return True
-        except Exception:
-            # Connection lost, reset socket
-            self._socket = None
+            sock.settimeout(_SOCKET_TIMEOUT)
+            sock.connect(str(self._socket_path))
+        except OSError:
+            sock.close()
+            self._schedule_reconnect()
             return False
+        
+        self._socket = sock
+        self._sock_fd = sock.fileno()
+        self._retry_delay = _RECONNECT_MIN
+        return True
     
-    def _cleanup(self):
-        """Cleanup on exit."""
+    def _schedule_reconnect(self):
+        """Delay the next connect attempt with exponential backoff."""
+        self._retry_at = time.monotonic() + self._retry_delay
+        self._retry_delay = min(self._retry_delay * 2, _RECONNECT_MAX)
+    
+    def _disconnect(self):
+        """Close the socket, if open."""
         if self._socket:
             try:
                 self._socket.close()
-            except Exception:
+            except OSError:
                 pass
             self._socket = None
+            self._sock_fd = -1
+    
+    def _enqueue(self, line: bytes) -> bool:
+        """Queue an event line. A full queue silently drops its oldest line."""
+        # deque.append is atomic, so callers never contend on a lock here.
+        # The worker clears _wakeup and _pending before draining, so a line
+        # appended while they are set is still picked up.
+        self._queue.append(line)
+        self._pending[0] = self
+        if not self._worker_started:
+            self._start_worker()
+        if not self._wakeup.is_set():
+            self._wakeup.set()
+        return True
+    
+    def _start_worker(self):
+        """Start the background worker, once."""
+        with self._worker_lock:
+            if not self._worker_started and not self._stopping:
+                self._worker.start()
+                self._worker_started = True
+    
+    def _emit(self, template: bytes, level: Level, *fields: Any) -> bool:
+        """Fill an event template and queue it for the background worker."""
+        try:
+            line = template % (_LEVEL_JSON[level], *map(_dumps, fields))
+        except (TypeError, ValueError, KeyError):
+            # orjson rejects some values the stdlib escapes (e.g. lone
+            # surrogates from surrogateescape-decoded paths), so retry
+            try:
+                line = template % (_LEVEL_JSON[level], *map(_json_dumps, fields))
+            except (TypeError, ValueError, KeyError):
+                # Unserializable field or unknown level
+                return False
+        
+        return self._enqueue(line)
+    
+    def _write(self, lines: List[bytes]) -> bool:
+        """Write event lines to Wraith in a single scatter-gather send."""
+        if not self._connect():
+            return False
+        
+        try:
+            remaining = sum(map(len, lines))
+            try:
+                # Fast path - one writev straight on the socket's fd
+                sent = os.writev(self._sock_fd, lines)
+            except BlockingIOError:
+                sent = 0
+            
+            while True:
+                remaining -= sent
+                if not remaining:
+                    return True
+                
+                # Short write - drop what was sent and let the socket
+                # (which honours its timeout) send the rest
+                i = 0
+                while sent >= len(lines[i]):
+                    sent -= len(lines[i])
+                    i += 1
+                lines = lines[i:]
+                lines[0] = lines[0][sent:]
+                sent = self._socket.sendmsg(lines)
+        except OSError:
+            # Connection lost, reconnect on a later batch
+            self._disconnect()
+            self._schedule_reconnect()
+            return False
+    
+    def _flush(self) -> bool:
+        """
+        Write all queued event lines to Wraith. Runs on the worker thread.
+        
+        Returns:
+            False once the worker should exit.
+        """
+        # Errors here must never end the thread, or queued events would
+        # silently pile up forever. An unexpected failure drops the batch.
+        queue = self._queue
+        
+        # Only this thread removes lines, so len() never overstates
+        while queue:
+            batch = [queue.popleft() for _ in range(min(len(queue), _BATCH_SIZE))]
+            try:
+                self._write(batch)
+            except Exception:
+                self._disconnect()
+                self._schedule_reconnect()
+        
+        if self._stopping:
+            self._disconnect()
+            return False
+        return True
+    
+    def _cleanup(self):
+        """Cleanup on exit."""
+        if self._worker.is_alive():
+            # The worker flushes pending events and closes its own socket
+            self._stopping = True
+            self._wakeup.set()
+            
+            # Not connected yet: the worker may still be spawning Wraith or
+            # connecting, so wait long enough for that to finish too
+            timeout = _EXIT_FLUSH_TIMEOUT
+            if self._socket is None:
+                timeout += _SPAWN_TIMEOUT + _SOCKET_TIMEOUT
+            self._worker.join(timeout=timeout)
+            return
+        
+        self._disconnect()
     
     # =========================================================================
     # Public API - Event methods
@@ -278,15 +546,12 @@ class WraithClient:
             level: Log level. Default: INFO
         
         Returns:
-            True if event was sent, False otherwise (never raises).
+            True if event was queued, False otherwise (never raises).
         """
-        return self._send({
-            "level": level.value,
-            "event_type": "tool_invoked",
-            "tool": tool,
-            "command": command,
-            "context": self._build_context(),
-        })
+        if not self._enabled:
+            return False
+        
+        return self._emit(self._tpl_invoked, level, tool, command)
     
     def tool_succeeded(
         self,
@@ -305,16 +570,12 @@ class WraithClient:
             level: Log level. Default: INFO
         
         Returns:
-            True if event was sent.
+            True if event was queued.
         """
-        return self._send({
-            "level": level.value,
-            "event_type": "tool_succeeded",
-            "tool": tool,
-            "command": command,
-            "duration_ms": duration_ms,
-            "context": self._build_context(),
-        })
+        if not self._enabled:
+            return False
+        
+        return self._emit(self._tpl_succeeded, level, tool, command, duration_ms)
     
     def tool_failed(
         self,
@@ -335,17 +596,14 @@ class WraithClient:
             level: Log level. Default: ERROR
         
         Returns:
-            True if event was sent.
+            True if event was queued.
         """
-        return self._send({
-            "level": level.value,
-            "event_type": "tool_failed",
-            "tool": tool,
-            "command": command,
-            "error_type": error_type,
-            "duration_ms": duration_ms,
-            "context": self._build_context(),
-        })
+        if not self._enabled:
+            return False
+        
+        return self._emit(
+            self._tpl_failed, level, tool, command, error_type, duration_ms
+        )
     
     def exception_unhandled(
         self,
@@ -364,19 +622,17 @@ class WraithClient:
             level: Log level. Default: FATAL
         
         Returns:
-            True if event was sent.
+            True if event was queued.
         """
-        message = {
-            "level": level.value,
-            "event_type": "exception_unhandled",
-            "tool": tool,
-            "exception_type": exception_type,
-            "context": self._build_context(),
-        }
+        if not self._enabled:
+            return False
+        
         if traceback:
-            message["traceback"] = traceback
+            return self._emit(
+                self._tpl_exception_tb, level, tool, exception_type, traceback
+            )
         
-        return self._send(message)
+        return self._emit(self._tpl_exception, level, tool, exception_type)
     
     def validation_failed(
         self,
@@ -395,19 +651,17 @@ class WraithClient:
             level: Log level. Default: WARNING
         
         Returns:
-            True if event was sent.
+            True if event was queued.
         """
-        message = {
-            "level": level.value,
-            "event_type": "validation_failed",
-            "tool": tool,
-            "validation_type": validation_type,
-            "context": self._build_context(),
-        }
+        if not self._enabled:
+            return False
+        
         if details:
-            message["details"] = details
+            return self._emit(
+                self._tpl_validation_details, level, tool, validation_type, details
+            )
         
-        return self._send(message)
+        return self._emit(self._tpl_validation, level, tool, validation_type)
     
     @contextmanager
     def track_command(self, tool: str, command: str):
@@ -421,20 +675,84 @@ class WraithClient:
         
         Automatically records invoked, succeeded/failed, and duration.
         """
+        if not self._enabled:
+            yield
+            return
+        
         self.tool_invoked(tool, command)
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         try:
             yield
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             self.tool_succeeded(tool, command, duration_ms)
         except Exception as e:
-            duration_ms = int((time.time() - start_time) * 1000)
+            duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             self.tool_failed(tool, command, type(e).__name__, duration_ms)
             raise
 
 
+def _run_worker(
+    client_ref: "weakref.ref[WraithClient]",
+    pending: List[Optional[WraithClient]],
+    wakeup: threading.Event,
+):
+    """Worker loop - wait for queued event lines and flush them to Wraith."""
+    while True:
+        wakeup.wait(_IDLE_CHECK)
+        
+        # Queued lines pin the client; otherwise it may have been collected
+        client = pending[0] or client_ref()
+        if client is None:
+            return
+        
+        wakeup.clear()
+        pending[0] = None
+        if not client._flush():
+            return
+        
+        # Don't keep the client alive while idle
+        client = None
+
+
+# Live clients, flushed at exit. Held weakly so unused clients can be freed.
+_clients: "weakref.WeakSet[WraithClient]" = weakref.WeakSet()
+
+
+def _cleanup_clients():
+    """Flush and close all live clients on exit."""
+    for client in list(_clients):
+        client._cleanup()
+
+
+atexit.register(_cleanup_clients)
+
+
+def _reset_clients_after_fork():
+    """Give every live client fresh worker state in a forked child."""
+    for client in list(_clients):
+        client._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
+
+
+# Global client, created on first use by get_client()
+_client: Optional[WraithClient] = None
+_client_lock = threading.Lock()
+
+
+def _init_client() -> WraithClient:
+    """Create the global client exactly once."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = WraithClient()
+    return _client
+
+
 # Convenience function for global client
 def get_client() -> WraithClient:
     """Get the global Wraith client instance."""
-    return WraithClient()
+    return _client or _init_client()